@@ -4,38 +4,96 @@ Simple benchmark comparing dict vs zdict performance.
 Tests insertion and lookup operations with configurable parameters.
 """
 
+import sys
 import time
-import random
+import tracemalloc
 import argparse
 import gc
-from statistics import mean, stdev
+import os
+
+import numpy as np
 
 # Import zdict
 from zdict import zdict, _C_EXTENSION_AVAILABLE
 
+try:
+    import numba
+    from numba import types as numba_types
+    from numba.typed import Dict as NumbaDict
 
-def benchmark_insertions(dict_type, num_insertions):
-    """Benchmark insertion of n entries into an empty dict."""
-    # Prepare data
-    keys = [f"key_{i:06d}" for i in range(num_insertions)]
-    values = [f"value_{i:06d}" for i in range(num_insertions)]
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
-    # Force garbage collection
-    gc.collect()
 
-    # Time the insertions
-    start_time = time.perf_counter()
+if NUMBA_AVAILABLE:
+
+    @numba.njit(cache=True)
+    def _insert_loop(d, keys, values):
+        for i in range(keys.shape[0]):
+            d[keys[i]] = values[i]
+
+    @numba.njit(cache=True)
+    def _lookup_loop(d, keys):
+        total = 0
+        for i in range(keys.shape[0]):
+            total += d[keys[i]]
+        return total
+
+
+def generate_strings(prefix, count):
+    """Generate zero-padded strings like ``key_000042`` in a single NumPy call."""
+    idx = np.arange(count)
+    return np.char.add(prefix, np.char.zfill(idx.astype(str), 6)).tolist()
+
 
-    if dict_type == dict:
-        d = dict()
-        for k, v in zip(keys, values):
-            d[k] = v
+def generate_keys(count, key_type="str", key_format="dec"):
+    """Generate benchmark keys of the requested type and string format."""
+    if key_type == "int":
+        # Integer hashes are the identity, leaving only the container cost
+        return list(range(count))
+    if key_format == "hex":
+        # Shorter keys like ``key_2a`` mean fewer bytes to hash and compare
+        return np.char.mod("key_%x", np.arange(count)).tolist()
+    return generate_strings("key_", count)
+
+
+def generate_values(count, key_type="str"):
+    """Generate benchmark values of the requested type."""
+    if key_type == "int":
+        return list(range(count))
+    return generate_strings("value_", count)
+
+
+def benchmark_insertions(dict_type, pairs, presized=False):
+    """Benchmark insertion of the given key/value pairs.
+
+    With ``presized`` the dict already holds every key, so the timed loop is
+    a pure overwrite workload with no table growth.
+    """
+    num_insertions = len(pairs)
+    if presized:
+        template = dict.fromkeys(k for k, _ in pairs)
+        d = template if dict_type == dict else zdict(template)
     else:
-        d = zdict()
-        for k, v in zip(keys, values):
-            d[k] = v
+        d = dict() if dict_type == dict else zdict()
+
+    # Bind hot callables to locals to keep lookup overhead out of the loop
+    perf_counter = time.perf_counter
+    setitem = d.__setitem__
 
-    end_time = time.perf_counter()
+    # Force garbage collection once the data is materialized and keep the
+    # collector from firing mid-measurement
+    gc.collect()
+    gc.disable()
+    try:
+        # Time the insertions
+        start_time = perf_counter()
+        for k, v in pairs:
+            setitem(k, v)
+        end_time = perf_counter()
+    finally:
+        gc.enable()
 
     total_time = end_time - start_time
     avg_time_per_op = total_time / num_insertions
@@ -43,59 +101,116 @@ def benchmark_insertions(dict_type, num_insertions):
     return d, total_time, avg_time_per_op
 
 
-def benchmark_lookups(d, num_lookups, num_keys):
-    """Benchmark random lookups with coverage of all keys."""
-    keys = list(d.keys())
-    lookup_times = []
+def benchmark_lookups(d, lookup_sequence):
+    """Benchmark lookups of the given key sequence."""
+    num_lookups = len(lookup_sequence)
 
-    # Create lookup sequence
-    lookups_per_key = num_lookups // num_keys
-    extra_lookups = num_lookups % num_keys
+    # Bind hot callables to locals to keep lookup overhead out of the loop
+    perf_counter = time.perf_counter
+    getitem = d.__getitem__
 
-    lookup_sequence = []
-    for key in keys:
-        # Random count between 0 and 10 for each key
-        count = random.randint(0, 10)
-        lookup_sequence.extend([key] * count)
+    # Warm-up pass outside the timed region
+    for key in lookup_sequence:
+        getitem(key)
+
+    # Split the sequence into up to 1000 blocks ahead of time. A single
+    # lookup is shorter than the clock resolution, so worst/best case come
+    # from per-block averages taken during the one timed pass.
+    num_blocks = min(1000, num_lookups)
+    block_size = num_lookups // num_blocks
+    blocks = [
+        lookup_sequence[i * block_size : (i + 1) * block_size]
+        for i in range(num_blocks - 1)
+    ]
+    blocks.append(lookup_sequence[(num_blocks - 1) * block_size :])
+    block_lengths = np.array([len(block) for block in blocks])
+    block_times = np.empty(num_blocks)
+
+    # Benchmark lookups with the collector out of the way
+    gc.collect()
+    gc.disable()
+    try:
+        for i, block in enumerate(blocks):
+            start = perf_counter()
+            for key in block:
+                getitem(key)
+            block_times[i] = perf_counter() - start
+    finally:
+        gc.enable()
+
+    total_time = float(block_times.sum())
+    avg_time_per_op = total_time / num_lookups
 
-    # Shuffle to randomize access pattern
-    random.shuffle(lookup_sequence)
+    per_op_times = block_times / block_lengths
+    worst_case = float(per_op_times.max())
+    best_case = float(per_op_times.min())
 
-    # Ensure we have exactly num_lookups
-    if len(lookup_sequence) > num_lookups:
-        lookup_sequence = lookup_sequence[:num_lookups]
-    else:
-        # Add more random lookups to reach num_lookups
-        while len(lookup_sequence) < num_lookups:
-            lookup_sequence.append(random.choice(keys))
+    return total_time, avg_time_per_op, worst_case, best_case
+
+
+def benchmark_memory(dict_type, pairs):
+    """Measure peak bytes allocated while building a dict from the pairs.
 
-    # Benchmark lookups
+    Keys and values already exist, so this is the cost of the table itself,
+    including slack from resizing.
+    """
     gc.collect()
+    tracemalloc.start()
+    try:
+        d = dict(pairs) if dict_type == dict else zdict(pairs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del d
+    return peak
 
-    # Measure individual operations for worst/best case
-    for key in lookup_sequence[:1000]:  # Sample first 1000 for individual timing
-        start = time.perf_counter()
-        _ = d[key]
-        end = time.perf_counter()
-        lookup_times.append(end - start)
 
-    # Measure total time for all lookups
-    start_time = time.perf_counter()
-    for key in lookup_sequence:
-        _ = d[key]
-    end_time = time.perf_counter()
+def benchmark_numba_baseline(num_insertions, lookup_indices):
+    """Benchmark a compiled typed-dict baseline with no interpreter overhead.
 
-    total_time = end_time - start_time
-    avg_time_per_op = total_time / num_lookups
+    zdict cannot be used from nopython mode, so this only gives a reference
+    point for the integer-key dict numbers.
+    """
+    keys = np.arange(num_insertions, dtype=np.int64)
+    lookup_keys = lookup_indices.astype(np.int64)
 
-    if lookup_times:
-        worst_case = max(lookup_times)
-        best_case = min(lookup_times)
-    else:
-        worst_case = avg_time_per_op
-        best_case = avg_time_per_op
+    # Trigger compilation outside the timed regions
+    warmup = NumbaDict.empty(numba_types.int64, numba_types.int64)
+    _insert_loop(warmup, keys[:1], keys[:1])
+    _lookup_loop(warmup, keys[:1])
 
-    return total_time, avg_time_per_op, worst_case, best_case
+    d = NumbaDict.empty(numba_types.int64, numba_types.int64)
+    perf_counter = time.perf_counter
+
+    gc.collect()
+    gc.disable()
+    try:
+        start_time = perf_counter()
+        _insert_loop(d, keys, keys)
+        insert_time = perf_counter() - start_time
+
+        start_time = perf_counter()
+        _lookup_loop(d, lookup_keys)
+        lookup_time = perf_counter() - start_time
+    finally:
+        gc.enable()
+
+    return insert_time / num_insertions, lookup_time / len(lookup_keys)
+
+
+def pin_to_single_cpu():
+    """Pin the process to one CPU to avoid migrations during measurement.
+
+    Returns the CPU index, or None where affinity cannot be set.
+    """
+    if not hasattr(os, "sched_setaffinity"):
+        return None
+    cpu = min(os.sched_getaffinity(0))
+    try:
+        os.sched_setaffinity(0, {cpu})
+    except OSError:
+        return None
+    return cpu
 
 
 def main():
@@ -115,14 +230,77 @@ def main():
         default=1,
         help="Number of experiments to run and average (default: 1)",
     )
+    parser.add_argument(
+        "--key-type",
+        choices=["str", "int"],
+        default="str",
+        help="Type of keys to benchmark; int removes string hashing (default: str)",
+    )
+    parser.add_argument(
+        "--key-format",
+        choices=["dec", "hex"],
+        default="dec",
+        help="String key format: zero-padded decimal or hex (default: dec)",
+    )
+    parser.add_argument(
+        "--presized",
+        action="store_true",
+        help="Pre-populate every key and time overwrites instead of growth",
+    )
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="Also report peak construction memory measured with tracemalloc",
+    )
+    parser.add_argument(
+        "--no-pin",
+        action="store_true",
+        help="Do not pin the benchmark to a single CPU",
+    )
+    parser.add_argument(
+        "--numba",
+        action="store_true",
+        help="Also time a Numba-compiled typed dict baseline (requires --key-type int)",
+    )
     args = parser.parse_args()
 
+    if args.numba and not NUMBA_AVAILABLE:
+        parser.error("--numba requires numba to be installed")
+    if args.numba and args.key_type != "int":
+        parser.error("--numba requires --key-type int")
+
+    pinned_cpu = None if args.no_pin else pin_to_single_cpu()
+
+    # Build the data and the lookup pattern once; experiments only rebuild
+    # the dicts under test. Keys are generated from a known format rather
+    # than copied out of a dict.
+    keys = generate_keys(args.insertions, args.key_type, args.key_format)
+    if args.key_type == "str":
+        keys = [sys.intern(k) for k in keys]
+    values = generate_values(args.insertions, args.key_type)
+    pairs = list(zip(keys, values))
+
+    np.random.seed(0)
+    lookup_indices = np.random.randint(0, args.insertions, size=args.lookups)
+    lookup_sequence = [keys[i] for i in lookup_indices.tolist()]
+
     print(f"🚀 dict vs zdict Performance Benchmark")
     print(f"=" * 60)
     print(f"Implementation: {'C Extension' if _C_EXTENSION_AVAILABLE else 'Pure Python Fallback'}")
     print(f"Insertions: {args.insertions:,}")
     print(f"Lookups: {args.lookups:,}")
+    if args.key_type == "str":
+        print(f"Key type: str ({args.key_format})")
+    else:
+        print(f"Key type: {args.key_type}")
+    if args.presized:
+        print("Insertions overwrite a presized table")
     print(f"Experiments: {args.num_experiments}")
+    if pinned_cpu is not None:
+        print(f"Pinned to CPU {pinned_cpu}")
+    else:
+        print("CPU not pinned (on Linux, try 'taskset -c 0 ...')")
+    print("Tip: run 'pyperf system tune' to disable frequency scaling")
     print()
 
     # Storage for results across experiments
@@ -136,6 +314,9 @@ def main():
     zdict_worsts = []
     zdict_bests = []
 
+    numba_insert_avgs = []
+    numba_lookup_avgs = []
+
     # Run experiments
     for exp_num in range(args.num_experiments):
         if args.num_experiments > 1:
@@ -144,10 +325,10 @@ def main():
         # Benchmark dict
         print("  Testing dict...")
         dict_instance, dict_insert_total, dict_insert_avg = benchmark_insertions(
-            dict, args.insertions
+            dict, pairs, args.presized
         )
         dict_lookup_total, dict_lookup_avg, dict_worst, dict_best = benchmark_lookups(
-            dict_instance, args.lookups, args.insertions
+            dict_instance, lookup_sequence
         )
 
         dict_insert_avgs.append(dict_insert_avg)
@@ -158,10 +339,10 @@ def main():
         # Benchmark zdict
         print("  Testing zdict...")
         zdict_instance, zdict_insert_total, zdict_insert_avg = benchmark_insertions(
-            zdict, args.insertions
+            zdict, pairs, args.presized
         )
         zdict_lookup_total, zdict_lookup_avg, zdict_worst, zdict_best = (
-            benchmark_lookups(zdict_instance, args.lookups, args.insertions)
+            benchmark_lookups(zdict_instance, lookup_sequence)
         )
 
         zdict_insert_avgs.append(zdict_insert_avg)
@@ -169,16 +350,36 @@ def main():
         zdict_worsts.append(zdict_worst)
         zdict_bests.append(zdict_best)
 
-    # Calculate averages
-    dict_insert_avg = mean(dict_insert_avgs)
-    dict_lookup_avg = mean(dict_lookup_avgs)
-    dict_worst = mean(dict_worsts)
-    dict_best = mean(dict_bests)
+        if args.numba:
+            print("  Testing numba typed dict...")
+            numba_insert_avg, numba_lookup_avg = benchmark_numba_baseline(
+                args.insertions, lookup_indices
+            )
+            numba_insert_avgs.append(numba_insert_avg)
+            numba_lookup_avgs.append(numba_lookup_avg)
 
-    zdict_insert_avg = mean(zdict_insert_avgs)
-    zdict_lookup_avg = mean(zdict_lookup_avgs)
-    zdict_worst = mean(zdict_worsts)
-    zdict_best = mean(zdict_bests)
+    # Calculate averages
+    dict_insert_avg = float(np.mean(dict_insert_avgs))
+    dict_lookup_avg = float(np.mean(dict_lookup_avgs))
+    dict_worst = float(np.mean(dict_worsts))
+    dict_best = float(np.mean(dict_bests))
+
+    zdict_insert_avg = float(np.mean(zdict_insert_avgs))
+    zdict_lookup_avg = float(np.mean(zdict_lookup_avgs))
+    zdict_worst = float(np.mean(zdict_worsts))
+    zdict_best = float(np.mean(zdict_bests))
+
+    # Sample standard deviations across experiments
+    show_spread = args.num_experiments > 1
+    if show_spread:
+        dict_insert_std = float(np.std(dict_insert_avgs, ddof=1))
+        dict_lookup_std = float(np.std(dict_lookup_avgs, ddof=1))
+        zdict_insert_std = float(np.std(zdict_insert_avgs, ddof=1))
+        zdict_lookup_std = float(np.std(zdict_lookup_avgs, ddof=1))
+
+    if args.numba:
+        numba_insert_avg = float(np.mean(numba_insert_avgs))
+        numba_lookup_avg = float(np.mean(numba_lookup_avgs))
 
     # Calculate performance deltas
     insert_delta = ((dict_insert_avg - zdict_insert_avg) / dict_insert_avg) * 100
@@ -197,28 +398,32 @@ def main():
 
     print("\n🔹 INSERTION PERFORMANCE (per operation):")
     print(f"  dict:   {dict_insert_avg * 1e9:.0f} ns", end="")
-    if args.num_experiments > 1 and len(dict_insert_avgs) > 1:
-        print(f" (±{stdev(dict_insert_avgs) * 1e9:.0f})")
+    if show_spread:
+        print(f" (±{dict_insert_std * 1e9:.0f})")
     else:
         print()
     print(f"  zdict:  {zdict_insert_avg * 1e9:.0f} ns", end="")
-    if args.num_experiments > 1 and len(zdict_insert_avgs) > 1:
-        print(f" (±{stdev(zdict_insert_avgs) * 1e9:.0f})")
+    if show_spread:
+        print(f" (±{zdict_insert_std * 1e9:.0f})")
     else:
         print()
+    if args.numba:
+        print(f"  numba:  {numba_insert_avg * 1e9:.0f} ns (compiled baseline)")
     print(f"  Performance delta: {insert_delta:+.1f}%")
 
     print("\n🔹 LOOKUP PERFORMANCE (per operation):")
     print(f"  dict:   {dict_lookup_avg * 1e9:.0f} ns", end="")
-    if args.num_experiments > 1 and len(dict_lookup_avgs) > 1:
-        print(f" (±{stdev(dict_lookup_avgs) * 1e9:.0f})")
+    if show_spread:
+        print(f" (±{dict_lookup_std * 1e9:.0f})")
     else:
         print()
     print(f"  zdict:  {zdict_lookup_avg * 1e9:.0f} ns", end="")
-    if args.num_experiments > 1 and len(zdict_lookup_avgs) > 1:
-        print(f" (±{stdev(zdict_lookup_avgs) * 1e9:.0f})")
+    if show_spread:
+        print(f" (±{zdict_lookup_std * 1e9:.0f})")
     else:
         print()
+    if args.numba:
+        print(f"  numba:  {numba_lookup_avg * 1e9:.0f} ns (compiled baseline)")
     print(f"  Performance delta: {lookup_delta:+.1f}%")
 
     print("\n🔹 WORST CASE LOOKUP:")
@@ -231,6 +436,13 @@ def main():
     print(f"  zdict:  {zdict_best * 1e9:.0f} ns")
     print(f"  Performance delta: {best_case_delta:+.1f}%")
 
+    if args.memory:
+        dict_peak = benchmark_memory(dict, pairs)
+        zdict_peak = benchmark_memory(zdict, pairs)
+        print("\n🔹 PEAK CONSTRUCTION MEMORY (tracemalloc):")
+        print(f"  dict:   {dict_peak / 1024:,.1f} KiB")
+        print(f"  zdict:  {zdict_peak / 1024:,.1f} KiB")
+
     print("\n🔹 NET PERFORMANCE:")
     overall_delta = (insert_delta + lookup_delta) / 2
     if overall_delta > 0:
@@ -3,6 +3,8 @@
 zdict Demo - Basic usage and performance comparison.
 """
 
+import operator
+import sys
 import time
 from zdict import zdict, _C_EXTENSION_AVAILABLE
 
@@ -72,19 +74,22 @@ def demo_performance_comparison():
     """Compare performance with built-in dict."""
     separator("Performance Comparison")
     
-    print("⚠️  Note: This is a simple demo. Use base_benchmark.py for detailed analysis.\n")
+    print("⚠️  Note: This is a simple demo. Use benchmarks/base_benchmark.py for detailed analysis.\n")
     
-    # Test data
+    # Test data, built once as (key, value) pairs so each timed
+    # construction populates exactly one hash table
     test_size = 10000
-    test_data = {f'key_{i}': f'value_{i}' for i in range(test_size)}
+    keys = [f'key_{i}' for i in range(test_size)]
+    values = [f'value_{i}' for i in range(test_size)]
+    pairs = tuple(zip(keys, values))
     
     # Time dict creation
     start = time.perf_counter()
-    regular = dict(test_data)
+    regular = dict(pairs)
     dict_time = time.perf_counter() - start
     
     start = time.perf_counter()
-    z = zdict(test_data)
+    z = zdict(pairs)
     zdict_time = time.perf_counter() - start
     
     print(f"Creation time ({test_size} items):")
@@ -92,18 +97,24 @@ def demo_performance_comparison():
     print(f"  zdict: {zdict_time*1000:.2f} ms")
     
     # Time lookups
-    lookup_keys = list(test_data.keys())[:100]
+    # Intern the lookup keys and warm both tables up so every timed lookup
+    # hits a key with its hash already cached
+    lookup_keys = [sys.intern(k) for k in keys[:100]]
+    
+    # itemgetter performs all 100 lookups in one C-level call, keeping
+    # interpreter overhead out of the comparison
+    getter = operator.itemgetter(*lookup_keys)
+    getter(regular)
+    getter(z)
     
     start = time.perf_counter()
     for _ in range(1000):
-        for key in lookup_keys:
-            _ = regular[key]
+        getter(regular)
     dict_lookup_time = time.perf_counter() - start
     
     start = time.perf_counter()
     for _ in range(1000):
-        for key in lookup_keys:
-            _ = z[key]
+        getter(z)
     zdict_lookup_time = time.perf_counter() - start
     
     print(f"\nLookup time (100k lookups):")
@@ -147,7 +158,7 @@ def main():
     
     separator("Demo Complete!")
     print("\n⚠️  Remember: zdict is experimental. Always benchmark with your use case!")
-    print("Run 'python base_benchmark.py --num-experiments 5' for detailed performance analysis.")
+    print("Run 'python benchmarks/base_benchmark.py --num-experiments 5' for detailed performance analysis.")
     print("\nFor more information, visit: https://github.com/AdiPat/zdict")
 
 
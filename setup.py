@@ -6,14 +6,39 @@ import sys
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
+# Profile-guided optimization is opt-in: build with ZDICT_PGO_GEN=1, run a
+# training workload, then rebuild with ZDICT_PGO_USE=1.
+PGO_DIR = os.path.abspath(os.path.join("build", "pgo"))
+PGO_GEN = bool(os.environ.get("ZDICT_PGO_GEN"))
+PGO_USE = bool(os.environ.get("ZDICT_PGO_USE"))
+
+if sys.platform == "win32":
+    extra_compile_args = ["/O2"]
+    extra_link_args = []
+    if PGO_GEN or PGO_USE:
+        extra_compile_args.append("/GL")
+        extra_link_args.append("/LTCG:PGINSTRUMENT" if PGO_GEN else "/LTCG:PGOPTIMIZE")
+else:
+    extra_compile_args = ["-O3", "-Wall", "-Wextra"]
+    extra_link_args = []
+    if PGO_GEN:
+        extra_compile_args.append(f"-fprofile-generate={PGO_DIR}")
+        extra_link_args.append(f"-fprofile-generate={PGO_DIR}")
+    elif PGO_USE:
+        extra_compile_args += [
+            f"-fprofile-use={PGO_DIR}",
+            "-fprofile-correction",
+            "-flto=auto",
+        ]
+        extra_link_args += [f"-fprofile-use={PGO_DIR}", "-flto=auto"]
+
 # Define the C extension module
 ext_modules = [
     Extension(
         "zdict._zdictcore",
         sources=["zdict/_zdictcore.c"],
-        extra_compile_args=(
-            ["-O3", "-Wall", "-Wextra"] if sys.platform != "win32" else ["/O2"]
-        ),
+        extra_compile_args=extra_compile_args,
+        extra_link_args=extra_link_args,
     )
 ]
 
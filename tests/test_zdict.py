@@ -24,6 +24,20 @@ class TestZDictBasics:
         assert z["a"] == 1
         assert z["b"] == 2
     
+    def test_creation_with_dict_copies_data(self):
+        """Test that zdict does not share storage with its source dict."""
+        data = {"a": 1}
+        z = zdict(data, b=2)
+        data["c"] = 3
+        assert z == {"a": 1, "b": 2}
+        assert data == {"a": 1, "c": 3}
+    
+    def test_creation_with_mapping(self):
+        """Test creating zdict from a non-dict mapping."""
+        from collections import UserDict
+        z = zdict(UserDict({"a": 1, "b": 2}))
+        assert z == {"a": 1, "b": 2}
+    
     def test_creation_with_kwargs(self):
         """Test creating zdict with kwargs."""
         z = zdict(a=1, b=2)
@@ -131,6 +145,9 @@ class TestZDictOperations:
         z_copy = z.copy()
         assert z_copy == z
         assert z_copy is not z
+        
+        z_copy["c"] = 3
+        assert "c" not in z
     
     def test_setdefault(self):
         """Test setdefault method."""
@@ -139,6 +156,15 @@ class TestZDictOperations:
         assert z.setdefault("b", 2) == 2
         assert z["b"] == 2
     
+    def test_pickle_roundtrip(self):
+        """Test pickling and unpickling."""
+        import pickle
+        z = zdict({"a": 1, "b": [2, 3]})
+        restored = pickle.loads(pickle.dumps(z))
+        assert type(restored) is type(z)
+        assert restored == z
+        assert restored is not z
+    
     def test_equality(self):
         """Test equality comparison."""
         z1 = zdict({"a": 1, "b": 2})
@@ -173,6 +199,27 @@ class TestZDictEdgeCases:
         assert z["a"] == 1
         assert z["b"] == 2
     
+    def test_iterable_of_list_pairs(self):
+        """Test that any two-element sequence is accepted as a pair, like dict."""
+        z = zdict([["a", 1]])
+        z.update([["b", 2], "cd"])
+        assert z == {"a": 1, "b": 2, "c": "d"}
+        
+        with pytest.raises(ValueError):
+            zdict([("a", 1, 2)])
+        with pytest.raises(TypeError):
+            z.update(42)
+    
+    def test_unhashable_key_raises_typeerror(self):
+        """Test that unhashable keys raise TypeError rather than KeyError."""
+        z = zdict({"a": 1})
+        with pytest.raises(TypeError):
+            _ = z[[]]
+        with pytest.raises(TypeError):
+            z.get([])
+        with pytest.raises(TypeError):
+            z.pop([], None)
+    
     def test_hashable(self):
         """Test that zdict is not hashable (like regular dict)."""
         z = zdict({"a": 1})
@@ -0,0 +1,138 @@
+"""
+Pure Python fallback for zdict, used when the C extension is unavailable.
+"""
+
+from typing import Any, Dict, ItemsView, Iterator, KeysView, Mapping, Union, ValuesView
+
+
+class zdict:
+    """
+    An experimental high-performance dict implementation.
+
+    This is a drop-in replacement for Python's built-in dict with
+    identical behavior. Currently experimental - performance may vary.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(
+        self,
+        data: Union[Dict[Any, Any], Mapping[Any, Any], None] = None,
+        **kwargs: Any,
+    ):
+        if type(data) is dict:
+            # An exact dict is cloned in one step, mirroring the C extension
+            self._data: Dict[Any, Any] = data.copy()
+        else:
+            self._data = {}
+
+            # Initialize with provided data; dict.update walks dicts and
+            # pair iterables in C without a Python-level loop per entry
+            if data is not None:
+                if isinstance(data, dict):
+                    self._data.update(data)
+                elif hasattr(data, "items"):
+                    self._data.update(data.items())
+                else:
+                    # Handle iterable of key-value pairs
+                    self._data.update(data)
+
+        # Add any keyword arguments
+        if kwargs:
+            self._data.update(kwargs)
+
+    # Core dict interface
+    def __getitem__(self, key: Any) -> Any:
+        """Get item by key."""
+        return self._data[key]
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        """Set item by key."""
+        self._data[key] = value
+
+    def __delitem__(self, key: Any) -> None:
+        """Delete item by key."""
+        del self._data[key]
+
+    def __contains__(self, key: Any) -> bool:
+        """Check if key is in dict."""
+        return key in self._data
+
+    def __len__(self) -> int:
+        """Return number of items."""
+        return len(self._data)
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over keys."""
+        return iter(self._data)
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"zdict({self._data!r})"
+
+    def __str__(self) -> str:
+        """String representation."""
+        return str(self._data)
+
+    def __eq__(self, other: Any) -> bool:
+        """Equality comparison."""
+        if isinstance(other, zdict):
+            other = other._data
+        elif not isinstance(other, dict):
+            return False
+        # Settle size mismatches before comparing entries
+        if len(self._data) != len(other):
+            return False
+        return self._data == other
+
+    def __hash__(self) -> int:
+        """Hash (not supported, matching dict behavior)."""
+        raise TypeError("unhashable type: 'zdict'")
+
+    # Dict methods
+    def keys(self) -> KeysView[Any]:
+        """Return keys view."""
+        return self._data.keys()
+
+    def values(self) -> ValuesView[Any]:
+        """Return values view."""
+        return self._data.values()
+
+    def items(self) -> ItemsView[Any, Any]:
+        """Return items view."""
+        return self._data.items()
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Get item with default."""
+        return self._data.get(key, default)
+
+    def pop(self, key: Any, *args: Any) -> Any:
+        """Remove and return item."""
+        return self._data.pop(key, *args)
+
+    def popitem(self) -> tuple[Any, Any]:
+        """Remove and return arbitrary item."""
+        return self._data.popitem()
+
+    def clear(self) -> None:
+        """Remove all items."""
+        self._data.clear()
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        """Update dict with items from another dict or iterable."""
+        self._data.update(*args, **kwargs)
+
+    def copy(self) -> "zdict":
+        """Return a shallow copy."""
+        # Bypass __init__; the copied dict is installed as-is
+        new = object.__new__(zdict)
+        new._data = self._data.copy()
+        return new
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        """Insert key with default if not present."""
+        return self._data.setdefault(key, default)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Return state information for pickling."""
+        return (self.__class__, (self._data,))
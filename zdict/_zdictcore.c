@@ -3,6 +3,19 @@
 #include <structmember.h>
 #include <string.h>
 
+/* Branch prediction and code placement hints */
+#if defined(__GNUC__) || defined(__clang__)
+#define Z_LIKELY(x) __builtin_expect(!!(x), 1)
+#define Z_UNLIKELY(x) __builtin_expect(!!(x), 0)
+#define Z_HOT __attribute__((hot))
+#define Z_COLD __attribute__((cold, noinline))
+#else
+#define Z_LIKELY(x) (x)
+#define Z_UNLIKELY(x) (x)
+#define Z_HOT
+#define Z_COLD
+#endif
+
 /* Forward declarations */
 static PyTypeObject ZDictType;
 
@@ -36,6 +49,27 @@ ZDict_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
     return (PyObject *)self;
 }
 
+/* Replace an empty backing dict with one sized for the length hint of
+   data, so bulk loads from mappings and iterables skip repeated resizes */
+static int
+ZDict_presize(ZDict *self, PyObject *data)
+{
+    if (PyDict_GET_SIZE(self->data) != 0)
+        return 0;
+    
+    Py_ssize_t hint = PyObject_LengthHint(data, 0);
+    if (hint < 0)
+        return -1;
+    if (hint <= 5)  /* fits the minimum table */
+        return 0;
+    
+    PyObject *presized = _PyDict_NewPresized(hint);
+    if (presized == NULL)
+        return -1;
+    Py_SETREF(self->data, presized);
+    return 0;
+}
+
 static int
 ZDict_init(ZDict *self, PyObject *args, PyObject *kwds)
 {
@@ -55,61 +89,35 @@ ZDict_init(ZDict *self, PyObject *args, PyObject *kwds)
     
     /* Initialize data */
     if (data != NULL) {
-        if (PyDict_Check(data)) {
+        if (PyDict_CheckExact(data) && PyDict_GET_SIZE(self->data) == 0) {
+            /* Clone the source table in a single allocation instead of
+               growing an empty dict one insert at a time */
+            PyObject *copy = PyDict_Copy(data);
+            if (copy == NULL)
+                return -1;
+            Py_SETREF(self->data, copy);
+        } else if (PyDict_Check(data)) {
             if (PyDict_Update(self->data, data) < 0)
                 return -1;
         } else {
-            /* Check if it has items() method (mapping-like) */
-            PyObject *items_method = PyObject_GetAttrString(data, "items");
-            if (items_method != NULL) {
-                Py_DECREF(items_method);
-                PyObject *items = PyMapping_Items(data);
-                if (items == NULL)
+            /* Check if it has keys() method (mapping-like) */
+            PyObject *keys_method = PyObject_GetAttrString(data, "keys");
+            if (keys_method != NULL) {
+                Py_DECREF(keys_method);
+                if (ZDict_presize(self, data) < 0)
+                    return -1;
+                /* Merge directly rather than materializing an items list */
+                if (PyDict_Merge(self->data, data, 1) < 0)
                     return -1;
-                
-                Py_ssize_t size = PyList_Size(items);
-                for (Py_ssize_t i = 0; i < size; i++) {
-                    PyObject *item = PyList_GetItem(items, i);
-                    PyObject *key = PyTuple_GetItem(item, 0);
-                    PyObject *value = PyTuple_GetItem(item, 1);
-                    if (PyDict_SetItem(self->data, key, value) < 0) {
-                        Py_DECREF(items);
-                        return -1;
-                    }
-                }
-                Py_DECREF(items);
             } else {
                 /* Clear the AttributeError */
                 PyErr_Clear();
                 
-                /* Try as iterable of pairs */
-                PyObject *iter = PyObject_GetIter(data);
-                if (iter == NULL) {
-                    PyErr_SetString(PyExc_TypeError, "data must be dict, mapping, or iterable of pairs");
+                if (ZDict_presize(self, data) < 0)
                     return -1;
-                }
-                
-                PyObject *item;
-                while ((item = PyIter_Next(iter)) != NULL) {
-                    if (!PyTuple_Check(item) || PyTuple_Size(item) != 2) {
-                        Py_DECREF(item);
-                        Py_DECREF(iter);
-                        PyErr_SetString(PyExc_ValueError, "Each item must be a 2-tuple");
-                        return -1;
-                    }
-                    
-                    PyObject *key = PyTuple_GetItem(item, 0);
-                    PyObject *value = PyTuple_GetItem(item, 1);
-                    if (PyDict_SetItem(self->data, key, value) < 0) {
-                        Py_DECREF(item);
-                        Py_DECREF(iter);
-                        return -1;
-                    }
-                    Py_DECREF(item);
-                }
-                Py_DECREF(iter);
                 
-                if (PyErr_Occurred())
+                /* Iterable of pairs: same rules and errors as dict() */
+                if (PyDict_MergeFromSeq2(self->data, data, 1) < 0)
                     return -1;
             }
         }
@@ -133,6 +141,13 @@ ZDict_init(ZDict *self, PyObject *args, PyObject *kwds)
     return 0;
 }
 
+/* Kept out of line so the lookup paths stay compact */
+static Z_COLD void
+ZDict_set_key_error(PyObject *key)
+{
+    PyErr_SetObject(PyExc_KeyError, key);
+}
+
 /* Sequence protocol */
 static Py_ssize_t
 ZDict_length(ZDict *self)
@@ -140,19 +155,21 @@ ZDict_length(ZDict *self)
     return PyDict_Size(self->data);
 }
 
-static PyObject *
+static Z_HOT PyObject *
 ZDict_getitem(ZDict *self, PyObject *key)
 {
-    PyObject *value = PyDict_GetItem(self->data, key);
-    if (value == NULL) {
-        PyErr_SetObject(PyExc_KeyError, key);
+    /* str keys reuse the hash cached on the object inside the lookup */
+    PyObject *value = PyDict_GetItemWithError(self->data, key);
+    if (Z_UNLIKELY(value == NULL)) {
+        if (!PyErr_Occurred())
+            ZDict_set_key_error(key);
         return NULL;
     }
     Py_INCREF(value);
     return value;
 }
 
-static int
+static Z_HOT int
 ZDict_setitem(ZDict *self, PyObject *key, PyObject *value)
 {
     if (value == NULL) {
@@ -164,7 +181,7 @@ ZDict_setitem(ZDict *self, PyObject *key, PyObject *value)
     }
 }
 
-static int
+static Z_HOT int
 ZDict_contains(ZDict *self, PyObject *key)
 {
     return PyDict_Contains(self->data, key);
@@ -177,6 +194,24 @@ ZDict_iter(ZDict *self)
     return PyObject_GetIter(self->data);
 }
 
+/* Argument count check for METH_FASTCALL methods, with dict's messages */
+static int
+ZDict_check_nargs(const char *name, Py_ssize_t nargs,
+                  Py_ssize_t min, Py_ssize_t max)
+{
+    if (Z_LIKELY(nargs >= min && nargs <= max))
+        return 1;
+    if (nargs < min)
+        PyErr_Format(PyExc_TypeError,
+                     "%s expected at least %zd argument%s, got %zd",
+                     name, min, min == 1 ? "" : "s", nargs);
+    else
+        PyErr_Format(PyExc_TypeError,
+                     "%s expected at most %zd arguments, got %zd",
+                     name, max, nargs);
+    return 0;
+}
+
 /* Methods */
 static PyObject *
 ZDict_keys(ZDict *self, PyObject *Py_UNUSED(ignored))
@@ -197,16 +232,18 @@ ZDict_items(ZDict *self, PyObject *Py_UNUSED(ignored))
 }
 
 static PyObject *
-ZDict_get(ZDict *self, PyObject *args)
+ZDict_get(ZDict *self, PyObject *const *args, Py_ssize_t nargs)
 {
-    PyObject *key;
-    PyObject *default_value = Py_None;
-    
-    if (!PyArg_ParseTuple(args, "O|O:get", &key, &default_value))
+    if (!ZDict_check_nargs("get", nargs, 1, 2))
         return NULL;
     
-    PyObject *value = PyDict_GetItem(self->data, key);
+    PyObject *key = args[0];
+    PyObject *default_value = nargs == 2 ? args[1] : Py_None;
+    
+    PyObject *value = PyDict_GetItemWithError(self->data, key);
     if (value == NULL) {
+        if (Z_UNLIKELY(PyErr_Occurred()))
+            return NULL;
         Py_INCREF(default_value);
         return default_value;
     }
@@ -215,31 +252,42 @@ ZDict_get(ZDict *self, PyObject *args)
 }
 
 static PyObject *
-ZDict_pop(ZDict *self, PyObject *args)
+ZDict_pop(ZDict *self, PyObject *const *args, Py_ssize_t nargs)
 {
-    PyObject *key;
-    PyObject *default_value = NULL;
-    
-    if (!PyArg_ParseTuple(args, "O|O:pop", &key, &default_value))
+    if (!ZDict_check_nargs("pop", nargs, 1, 2))
         return NULL;
     
-    PyObject *value = PyDict_GetItem(self->data, key);
-    if (value == NULL) {
-        if (default_value == NULL) {
-            PyErr_SetObject(PyExc_KeyError, key);
+    PyObject *key = args[0];
+    PyObject *default_value = nargs == 2 ? args[1] : NULL;
+    
+#if PY_VERSION_HEX >= 0x030D0000
+    /* Find and remove the entry in a single lookup */
+    PyObject *value;
+    int found = PyDict_Pop(self->data, key, &value);
+    if (Z_UNLIKELY(found < 0))
+        return NULL;
+    if (found)
+        return value;
+#else
+    PyObject *value = PyDict_GetItemWithError(self->data, key);
+    if (value != NULL) {
+        Py_INCREF(value);
+        if (PyDict_DelItem(self->data, key) < 0) {
+            Py_DECREF(value);
             return NULL;
         }
-        Py_INCREF(default_value);
-        return default_value;
+        return value;
     }
+    if (Z_UNLIKELY(PyErr_Occurred()))
+        return NULL;
+#endif
     
-    Py_INCREF(value);
-    if (PyDict_DelItem(self->data, key) < 0) {
-        Py_DECREF(value);
+    if (Z_UNLIKELY(default_value == NULL)) {
+        ZDict_set_key_error(key);
         return NULL;
     }
-    
-    return value;
+    Py_INCREF(default_value);
+    return default_value;
 }
 
 static PyObject *
@@ -293,33 +341,9 @@ ZDict_update(ZDict *self, PyObject *args, PyObject *kwds)
                 /* Clear AttributeError */
                 PyErr_Clear();
                 
-                /* Try as iterable of pairs */
-                PyObject *iter = PyObject_GetIter(other);
-                if (iter == NULL) {
-                    PyErr_SetString(PyExc_TypeError, 
-                                    "update() argument must be dict, mapping, or iterable of pairs");
+                /* Iterable of pairs: same rules and errors as dict.update() */
+                if (PyDict_MergeFromSeq2(self->data, other, 1) < 0)
                     return NULL;
-                }
-                
-                PyObject *item;
-                while ((item = PyIter_Next(iter)) != NULL) {
-                    if (!PyTuple_Check(item) || PyTuple_Size(item) != 2) {
-                        Py_DECREF(item);
-                        Py_DECREF(iter);
-                        PyErr_SetString(PyExc_ValueError, "update sequence element must be 2-tuple");
-                        return NULL;
-                    }
-                    
-                    PyObject *key = PyTuple_GetItem(item, 0);
-                    PyObject *value = PyTuple_GetItem(item, 1);
-                    if (PyDict_SetItem(self->data, key, value) < 0) {
-                        Py_DECREF(item);
-                        Py_DECREF(iter);
-                        return NULL;
-                    }
-                    Py_DECREF(item);
-                }
-                Py_DECREF(iter);
             }
         }
     }
@@ -333,13 +357,12 @@ ZDict_update(ZDict *self, PyObject *args, PyObject *kwds)
 static PyObject *
 ZDict_copy(ZDict *self, PyObject *Py_UNUSED(ignored))
 {
-    /* Create a new ZDict instance */
-    ZDict *new_zdict = (ZDict *)ZDict_new(&ZDictType, NULL, NULL);
+    /* Allocate directly so no throwaway empty dict is created */
+    ZDict *new_zdict = (ZDict *)ZDictType.tp_alloc(&ZDictType, 0);
     if (new_zdict == NULL)
         return NULL;
     
     /* Copy the data */
-    Py_DECREF(new_zdict->data);
     new_zdict->data = PyDict_Copy(self->data);
     if (new_zdict->data == NULL) {
         Py_DECREF(new_zdict);
@@ -350,22 +373,25 @@ ZDict_copy(ZDict *self, PyObject *Py_UNUSED(ignored))
 }
 
 static PyObject *
-ZDict_setdefault(ZDict *self, PyObject *args)
+ZDict_reduce(ZDict *self, PyObject *Py_UNUSED(ignored))
 {
-    PyObject *key;
-    PyObject *default_value = Py_None;
-    
-    if (!PyArg_ParseTuple(args, "O|O:setdefault", &key, &default_value))
+    /* Pickle as type(self)(data) so unpickling clones one dict in C */
+    return Py_BuildValue("(O(O))", (PyObject *)Py_TYPE(self), self->data);
+}
+
+static PyObject *
+ZDict_setdefault(ZDict *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    if (!ZDict_check_nargs("setdefault", nargs, 1, 2))
         return NULL;
     
-    PyObject *value = PyDict_GetItem(self->data, key);
-    if (value == NULL) {
-        if (PyDict_SetItem(self->data, key, default_value) < 0)
-            return NULL;
-        
-        Py_INCREF(default_value);
-        return default_value;
-    }
+    PyObject *key = args[0];
+    PyObject *default_value = nargs == 2 ? args[1] : Py_None;
+    
+    /* Lookup and insert-if-missing in a single probe; returns a borrowed ref */
+    PyObject *value = PyDict_SetDefault(self->data, key, default_value);
+    if (value == NULL)
+        return NULL;
     
     Py_INCREF(value);
     return value;
@@ -375,7 +401,7 @@ ZDict_setdefault(ZDict *self, PyObject *args)
 static PyObject *
 ZDict_richcompare(PyObject *self, PyObject *other, int op)
 {
-    if (op != Py_EQ && op != Py_NE) {
+    if (Z_UNLIKELY(op != Py_EQ && op != Py_NE)) {
         Py_RETURN_NOTIMPLEMENTED;
     }
     
@@ -383,7 +409,7 @@ ZDict_richcompare(PyObject *self, PyObject *other, int op)
     PyObject *self_dict = zd_self->data;
     PyObject *other_dict = NULL;
     
-    if (Py_TYPE(other) == &ZDictType) {
+    if (PyObject_TypeCheck(other, &ZDictType)) {
         other_dict = ((ZDict *)other)->data;
     } else if (PyDict_Check(other)) {
         other_dict = other;
@@ -394,9 +420,17 @@ ZDict_richcompare(PyObject *self, PyObject *other, int op)
             Py_RETURN_TRUE;
     }
     
-    int result = PyObject_RichCompareBool(self_dict, other_dict, Py_EQ);
-    if (result < 0)
-        return NULL;
+    /* Settle identical storage and size mismatches without walking entries */
+    int result;
+    if (self_dict == other_dict) {
+        result = 1;
+    } else if (PyDict_GET_SIZE(self_dict) != PyDict_GET_SIZE(other_dict)) {
+        result = 0;
+    } else {
+        result = PyObject_RichCompareBool(self_dict, other_dict, Py_EQ);
+        if (result < 0)
+            return NULL;
+    }
     
     if (op == Py_EQ)
         return PyBool_FromLong(result);
@@ -416,13 +450,7 @@ ZDict_hash(ZDict *self)
 static PyObject *
 ZDict_repr(ZDict *self)
 {
-    PyObject *dict_repr = PyObject_Repr(self->data);
-    if (dict_repr == NULL)
-        return NULL;
-    
-    PyObject *result = PyUnicode_FromFormat("zdict(%U)", dict_repr);
-    Py_DECREF(dict_repr);
-    return result;
+    return PyUnicode_FromFormat("zdict(%R)", self->data);
 }
 
 static PyObject *
@@ -437,13 +465,14 @@ static PyMethodDef ZDict_methods[] = {
     {"keys", (PyCFunction)ZDict_keys, METH_NOARGS, "Return a view of the dict's keys"},
     {"values", (PyCFunction)ZDict_values, METH_NOARGS, "Return a view of the dict's values"},
     {"items", (PyCFunction)ZDict_items, METH_NOARGS, "Return a view of the dict's items"},
-    {"get", (PyCFunction)ZDict_get, METH_VARARGS, "Get item with default"},
-    {"pop", (PyCFunction)ZDict_pop, METH_VARARGS, "Remove and return item"},
+    {"get", (PyCFunction)(void (*)(void))ZDict_get, METH_FASTCALL, "Get item with default"},
+    {"pop", (PyCFunction)(void (*)(void))ZDict_pop, METH_FASTCALL, "Remove and return item"},
     {"popitem", (PyCFunction)ZDict_popitem, METH_NOARGS, "Remove and return arbitrary item"},
     {"clear", (PyCFunction)ZDict_clear, METH_NOARGS, "Remove all items"},
     {"update", (PyCFunction)ZDict_update, METH_VARARGS | METH_KEYWORDS, "Update dict with items from another dict or iterable"},
     {"copy", (PyCFunction)ZDict_copy, METH_NOARGS, "Return a shallow copy"},
-    {"setdefault", (PyCFunction)ZDict_setdefault, METH_VARARGS, "Insert key with default if not present"},
+    {"setdefault", (PyCFunction)(void (*)(void))ZDict_setdefault, METH_FASTCALL, "Insert key with default if not present"},
+    {"__reduce__", (PyCFunction)ZDict_reduce, METH_NOARGS, "Return state information for pickling"},
     {NULL}  /* Sentinel */
 };
 